@@ -24,11 +24,7 @@ def _accept_additional_argument(*args, fun: Callable, arg: str, **kwargs):
     Returns:
         The return value of the function.
     """
-    try:
-        del kwargs[arg]
-    except KeyError:
-        pass
-
+    kwargs.pop(arg, None)
     return fun(*args, **kwargs)
 
 
@@ -4,9 +4,20 @@ transformations. Some of it probably belongs elsewhere.
 from __future__ import annotations
 
 from abc import ABCMeta
-from typing import Any, Optional, Protocol, TypeVar, Union, cast
-
-from numpy.random import Generator, SeedSequence
+from copy import deepcopy
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Optional,
+    Protocol,
+    Type,
+    TypeVar,
+    Union,
+    runtime_checkable,
+)
+
+from numpy.random import BitGenerator, Generator, Philox, SeedSequence
 from numpy.typing import NDArray
 
 __all__ = [
@@ -31,12 +42,14 @@ class ReduceFunction(Protocol[R]):
         ...
 
 
+@runtime_checkable
 class SupervisedModel(Protocol):
     """This is the minimal Protocol that valuation methods require from
     models in order to work.
 
     All that is needed are the standard sklearn methods `fit()`, `predict()` and
-    `score()`.
+    `score()`. The protocol can be used with `isinstance()`, which checks only
+    that these methods exist, not their signatures.
     """
 
     def fit(self, x: NDArray, y: NDArray):
@@ -74,7 +87,30 @@ class NoPublicConstructor(ABCMeta):
         return super().__call__(*args, **kwargs)
 
 
-Seed = Union[int, Generator]
+Seed = Union[int, Generator, BitGenerator]
+
+
+def _bit_generator_seed_sequence(bit_generator: BitGenerator) -> SeedSequence:
+    """Derives a SeedSequence from the current state of a bit generator.
+
+    The seed sequence of a bit generator does not capture all of its state,
+    e.g. the counter of a [Philox][numpy.random.Philox] generator, and it is
+    `None` if the generator was created with a key. Instead, entropy is drawn
+    from a copy of the generator, leaving the original untouched.
+    """
+    return SeedSequence(deepcopy(bit_generator).random_raw(4))
+
+
+# Maps the exact type of a seed to the function returning its SeedSequence,
+# avoiding a chain of isinstance() checks for the common cases. Anything else,
+# e.g. subclasses or numpy integers, goes through the checks.
+_SEED_SEQUENCE_GETTERS: Dict[Type, Callable[[Any], SeedSequence]] = {
+    SeedSequence: lambda seed: seed,
+    Generator: lambda seed: _bit_generator_seed_sequence(seed.bit_generator),
+    Philox: _bit_generator_seed_sequence,
+    int: SeedSequence,
+    type(None): SeedSequence,
+}
 
 
 def ensure_seed_sequence(
@@ -82,20 +118,33 @@ def ensure_seed_sequence(
 ) -> SeedSequence:
     """
     If the passed seed is a SeedSequence object then it is returned as is. If it is
-    a Generator the internal protected seed sequence from the generator gets extracted.
+    a Generator or a bit generator like [Philox][numpy.random.Philox], a new
+    SeedSequence is derived from the current state of the bit generator, without
+    advancing it. A Generator and its bit generator yield the same sequence.
     Otherwise, a new SeedSequence object is created from the passed (optional) seed.
 
     Args:
-        seed: Either an int, a Generator object a SeedSequence object or None.
+        seed: Either an int, a Generator object, a BitGenerator object, a
+            SeedSequence object or None.
 
     Returns:
         A SeedSequence object.
 
     !!! tip "New in version 0.7.0"
+
+    !!! tip "Changed in version 0.7.1"
+        Added support for bit generators. Generators are converted using the
+        state of their bit generator instead of the seed sequence they were
+        created with.
     """
+    getter = _SEED_SEQUENCE_GETTERS.get(type(seed))
+    if getter is not None:
+        return getter(seed)
     if isinstance(seed, SeedSequence):
         return seed
     elif isinstance(seed, Generator):
-        return cast(SeedSequence, seed.bit_generator.seed_seq)  # type: ignore
+        return _bit_generator_seed_sequence(seed.bit_generator)
+    elif isinstance(seed, BitGenerator):
+        return _bit_generator_seed_sequence(seed)
     else:
         return SeedSequence(seed)
@@ -25,6 +25,7 @@ for testing and for demonstration purposes.
 import logging
 import warnings
 from dataclasses import asdict
+from functools import cached_property
 from typing import Dict, FrozenSet, Iterable, Optional, Tuple, Union, cast
 
 import numpy as np
@@ -251,6 +252,18 @@ class Utility:
         """Signature used for caching model results."""
         return self._signature
 
+    @cached_property
+    def total_utility(self) -> float:
+        """Utility of the full set of indices.
+
+        Monte Carlo methods require this value repeatedly, e.g. at the end of
+        every permutation, so it is computed only once and stored in the
+        object. Because the value is pickled along with it, it should be
+        accessed before sending the utility to workers. Note that the utility
+        of the empty set is always 0 and is never computed.
+        """
+        return self(self.data.indices)
+
     @property
     def cache_stats(self) -> Optional[CacheStats]:
         """Cache statistics are gathered when cache is enabled.
@@ -348,6 +361,12 @@ class DataUtilityLearning:
         """Returns the wrapped utility's [Dataset][pydvl.utils.dataset.Dataset]."""
         return self.utility.data
 
+    @property
+    def total_utility(self) -> float:
+        """Utility of the full set of indices. Like any other, this value is
+        stored as a utility sample or predicted once the budget is exhausted."""
+        return self(self.data.indices)
+
 
 class MinerGameUtility(Utility):
     r"""Toy game utility that is used for testing and demonstration purposes.
@@ -109,6 +109,10 @@ class ValueItem(Generic[IndexT, NameT]):
         count: Number of updates for this value
     """
 
+    # Items are created on every update of and iteration over a result, so
+    # they don't carry a __dict__.
+    __slots__ = ("index", "name", "value", "variance", "count")
+
     index: IndexT
     name: NameT
     value: float
@@ -44,7 +44,8 @@ def compute_shapley_values(
       Shapley. Implemented in
       [combinatorial_exact_shapley()][pydvl.value.shapley.naive.combinatorial_exact_shapley].
     - `combinatorial_montecarlo`:  uses the approximate Monte Carlo
-      implementation of combinatorial data Shapley. Implemented in
+      implementation of combinatorial data Shapley. Accepts `stratified=True`
+      to stratify the sampling of subsets by size. Implemented in
       [combinatorial_montecarlo_shapley()][pydvl.value.shapley.montecarlo.combinatorial_montecarlo_shapley].
     - `permutation_exact`: uses the permutation-based implementation of data
       Shapley. Computation is **not parallelized**. Implemented in
@@ -114,7 +115,12 @@ def compute_shapley_values(
         )
     elif mode == ShapleyMode.CombinatorialMontecarlo:
         return combinatorial_montecarlo_shapley(
-            u, done=done, n_jobs=n_jobs, seed=seed, progress=progress
+            u,
+            done=done,
+            stratified=kwargs.pop("stratified", False),
+            n_jobs=n_jobs,
+            seed=seed,
+            progress=progress,
         )
     elif mode == ShapleyMode.CombinatorialExact:
         return combinatorial_exact_shapley(u, n_jobs=n_jobs, progress=progress)
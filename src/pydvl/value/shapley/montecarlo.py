@@ -76,10 +76,47 @@ logger = logging.getLogger(__name__)
 __all__ = ["permutation_montecarlo_shapley", "combinatorial_montecarlo_shapley"]
 
 
+def _permutation_scores(
+    u: Utility,
+    permutation: NDArray,
+    truncation: TruncationPolicy,
+    total_score: Optional[float] = None,
+) -> NDArray[np.float_]:
+    """Computes the utilities of all prefixes of a permutation.
+
+    Args:
+        u: Utility object with model, data, and scoring function
+        permutation: The permutation of the data indices.
+        truncation: A callable which decides whether to interrupt
+            processing a permutation and set all subsequent scores to the last
+            one computed.
+        total_score: If known, the utility of the full set of indices, which
+            is then not recomputed for the last prefix.
+
+    Returns:
+        An array of length `len(permutation) + 1` with the utility of the
+            first `i` elements of the permutation at position `i`.
+    """
+    n = len(permutation)
+    # The utility of the empty set is 0 and needn't be computed
+    scores = np.zeros(n + 1)
+    truncation.reset()
+    for i in range(n):
+        if i == n - 1 and total_score is not None:
+            scores[n] = total_score
+        else:
+            scores[i + 1] = u(permutation[: i + 1])
+        if truncation(i, scores[i + 1]):
+            scores[i + 2 :] = scores[i + 1]
+            break
+    return scores
+
+
 def _permutation_montecarlo_one_step(
     u: Utility,
     truncation: TruncationPolicy,
     algorithm_name: str,
+    antithetic: bool = False,
     seed: Optional[Union[Seed, SeedSequence]] = None,
 ) -> ValuationResult:
     """Helper function for [permutation_montecarlo_shapley()][pydvl.value.shapley.montecarlo.permutation_montecarlo_shapley].
@@ -92,37 +129,80 @@ def _permutation_montecarlo_one_step(
             processing a permutation and set all subsequent marginals to zero.
         algorithm_name: For the results object. Used internally by different
             variants of Shapley using this subroutine
+        antithetic: If `True`, the marginals of the reversed permutation are
+            computed as well, and the result holds the average of both.
         seed: Either an instance of a numpy random number generator or a seed for it.
 
     Returns:
         An object with the results
     """
-
-    result = ValuationResult.zeros(
-        algorithm=algorithm_name, indices=u.data.indices, data_names=u.data.data_names
-    )
-    prev_score = 0.0
-    permutation = np.random.default_rng(seed).permutation(u.data.indices)
-    permutation_done = False
-    truncation.reset()
-    for i, idx in enumerate(permutation):
-        if permutation_done:
-            score = prev_score
-        else:
-            score = u(permutation[: i + 1])
-        marginal = score - prev_score
-        result.update(idx, marginal)
-        prev_score = score
-        if not permutation_done and truncation(i, score):
-            permutation_done = True
-    nans = np.isnan(result.values).sum()
+    n = len(u.data.indices)
+    positions = np.random.default_rng(seed).permutation(n)
+    permutation = u.data.indices[positions]
+    # Marginals are the differences of the utilities of consecutive prefixes.
+    # All permutations end with the full set, whose utility is cached.
+    total_score = u.total_utility
+    scores = _permutation_scores(u, permutation, truncation, total_score)
+    values = np.empty(n)
+    values[positions] = np.diff(scores)
+    if antithetic:
+        reversed_scores = _permutation_scores(
+            u, permutation[::-1], truncation, total_score
+        )
+        values[positions[::-1]] += np.diff(reversed_scores)
+        values /= 2
+    nans = np.isnan(values).sum()
     if nans > 0:
         logger.warning(
             f"{nans} NaN values in current permutation, ignoring. "
             "Consider setting a default value for the Scorer"
         )
-        result = ValuationResult.empty(algorithm=algorithm_name)
-    return result
+        return ValuationResult.empty(algorithm=algorithm_name)
+    # Each index has received exactly one update, so there is no need to go
+    # through ValuationResult.update() for every marginal.
+    return ValuationResult(
+        algorithm=algorithm_name,
+        indices=np.array(u.data.indices),
+        data_names=u.data.data_names,
+        values=values,
+        variances=np.zeros(n),
+        counts=np.ones(n, dtype=np.int_),
+    )
+
+
+def _permutation_montecarlo_batch(
+    u: Utility,
+    truncation: TruncationPolicy,
+    algorithm_name: str,
+    antithetic: bool,
+    seeds: Sequence[SeedSequence],
+) -> ValuationResult:
+    """Helper function for [permutation_montecarlo_shapley()][pydvl.value.shapley.montecarlo.permutation_montecarlo_shapley].
+
+    Computes the marginals of one permutation per seed in a single job, so that
+    the cost of sending the job and the utility to a worker is shared by all of
+    them.
+
+    Args:
+        u: Utility object with model, data, and scoring function
+        truncation: A callable which decides whether to interrupt
+            processing a permutation and set all subsequent marginals to zero.
+        algorithm_name: For the results object.
+        antithetic: Whether to pair each permutation with its reverse.
+        seeds: One seed sequence per permutation to sample.
+
+    Returns:
+        An object with the results of all permutations.
+    """
+    return reduce(
+        operator.add,
+        (
+            _permutation_montecarlo_one_step(
+                u, truncation, algorithm_name, antithetic, seed=seed
+            )
+            for seed in seeds
+        ),
+    )
 
 
 @deprecated(
@@ -138,6 +218,8 @@ def permutation_montecarlo_shapley(
     done: StoppingCriterion,
     *,
     truncation: TruncationPolicy = NoTruncation(),
+    antithetic: bool = False,
+    batch_size: int = 1,
     n_jobs: int = 1,
     config: ParallelConfig = ParallelConfig(),
     progress: bool = False,
@@ -174,9 +256,17 @@ def permutation_montecarlo_shapley(
     proximity, implemented in
     [BootstrapTruncation][pydvl.value.shapley.truncated.BootstrapTruncation].
 
+    With `antithetic=True`, each sampled permutation is paired with its
+    reverse, and the marginals of both are averaged into one update. The two
+    estimates are negatively correlated, which reduces the variance with
+    respect to using two independent permutations for the same number of
+    utility evaluations.
+
     We keep sampling permutations and updating all shapley values
     until the [StoppingCriterion][pydvl.value.stopping.StoppingCriterion] returns
-    `True`.
+    `True`. Each job sent to the workers processes `batch_size` permutations.
+    For cheap utilities, larger batches reduce the overhead of dispatching
+    jobs, at the cost of checking the stopping criterion less often.
 
     Args:
         u: Utility object with model, data, and scoring function.
@@ -184,6 +274,9 @@ def permutation_montecarlo_shapley(
         truncation: An optional callable which decides whether to interrupt
             processing a permutation and set all subsequent marginals to
             zero. Typically used to stop computation when the marginal is small.
+        antithetic: Whether to pair each permutation with its reverse and
+            average their marginals.
+        batch_size: Number of permutations to process in each job.
         n_jobs: number of jobs across which to distribute the computation.
         config: Object configuring parallel computation, with cluster address,
             number of cpus, etc.
@@ -192,9 +285,20 @@ def permutation_montecarlo_shapley(
 
     Returns:
         Object with the data values.
+
+    !!! tip "Changed in version 0.7.1"
+        Added antithetic sampling of permutations and batching of permutations
+        into jobs.
     """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+
     algorithm = "permutation_montecarlo_shapley"
 
+    # The utility of the full set ends every permutation. Compute it once, so
+    # that it is sent to the workers along with the utility
+    _ = u.total_utility
+
     parallel_backend = init_parallel_backend(config)
     u = parallel_backend.put(u)
     max_workers = effective_n_jobs(n_jobs, config)
@@ -225,14 +329,15 @@ def permutation_montecarlo_shapley(
 
             # Ensure that we always have n_submitted_jobs in the queue or running
             n_remaining_slots = n_submitted_jobs - len(pending)
-            seeds = seed_sequence.spawn(n_remaining_slots)
+            seeds = seed_sequence.spawn(n_remaining_slots * batch_size)
             for i in range(n_remaining_slots):
                 future = executor.submit(
-                    _permutation_montecarlo_one_step,
+                    _permutation_montecarlo_batch,
                     u,
                     truncation,
                     algorithm,
-                    seed=seeds[i],
+                    antithetic,
+                    seeds=seeds[i * batch_size : (i + 1) * batch_size],
                 )
                 pending.add(future)
 
@@ -242,6 +347,7 @@ def _combinatorial_montecarlo_shapley(
     u: Utility,
     done: StoppingCriterion,
     *,
+    stratified: bool = False,
     progress: bool = False,
     job_id: int = 1,
     seed: Optional[Seed] = None,
@@ -257,6 +363,9 @@ def _combinatorial_montecarlo_shapley(
         u: Utility object with model, data, and scoring function
         done: Check on the results which decides when to stop sampling
             subsets for an index.
+        stratified: Whether to cycle through subset sizes for each index,
+            sampling one subset of each size uniformly at random, instead of
+            sampling subsets uniformly from the powerset.
         progress: Whether to display progress bars for each job.
         seed: Either an instance of a numpy random number generator or a seed
             for it.
@@ -266,12 +375,6 @@ def _combinatorial_montecarlo_shapley(
         The results for the indices.
     """
     n = len(u.data)
-
-    # Correction coming from Monte Carlo integration so that the mean of the
-    # marginals converges to the value: the uniform distribution over the
-    # powerset of a set with n-1 elements has mass 2^{n-1} over each subset. The
-    # additional factor n corresponds to the one in the Shapley definition
-    correction = 2 ** (n - 1) / n
     result = ValuationResult.zeros(
         algorithm="combinatorial_montecarlo_shapley",
         indices=np.array(indices, dtype=np.int_),
@@ -279,16 +382,39 @@ def _combinatorial_montecarlo_shapley(
     )
 
     rng = np.random.default_rng(seed)
-    repeat_indices = takewhile(lambda _: not done(result), cycle(indices))
+    if stratified:
+        # The next subset size to sample for each index, starting at a random one
+        sizes = rng.integers(n, size=len(indices))
+    else:
+        # Correction coming from Monte Carlo integration so that the mean of the
+        # marginals converges to the value: the uniform distribution over the
+        # powerset of a set with n-1 elements has mass 2^{n-1} over each subset.
+        # The additional factor n corresponds to the one in the Shapley
+        # definition. Together with the Shapley coefficient for subsets of size
+        # k, this is tabulated once instead of computing binomials for every
+        # sample.
+        weights = np.array(
+            [2 ** (n - 1) / (n * math.comb(n - 1, k)) for k in range(n)],
+            dtype=np.float64,
+        )
+    repeat_indices = takewhile(lambda _: not done(result), cycle(enumerate(indices)))
     pbar = tqdm(disable=not progress, position=job_id, total=100, unit="%")
-    for idx in repeat_indices:
+    for position, idx in repeat_indices:
         pbar.n = 100 * done.completion()
         pbar.refresh()
         # Randomly sample subsets of full dataset without idx
         subset = np.setxor1d(u.data.indices, [idx], assume_unique=True)
-        s = next(random_powerset(subset, n_samples=1, seed=rng))
-        marginal = (u({idx}.union(s)) - u(s)) / math.comb(n - 1, len(s))
-        result.update(idx, correction * marginal)
+        if stratified:
+            # All sizes have the same weight 1/n in the Shapley value, and all
+            # subsets of one size have the same coefficient, so sampling each
+            # size equally often makes the plain mean of marginals unbiased.
+            s = rng.choice(subset, size=sizes[position], replace=False)
+            sizes[position] = (sizes[position] + 1) % n
+            marginal = u({idx}.union(s)) - u(s)
+        else:
+            s = next(random_powerset(subset, n_samples=1, seed=rng))
+            marginal = weights[len(s)] * (u({idx}.union(s)) - u(s))
+        result.update(idx, marginal)
 
     return result
 
@@ -297,6 +423,7 @@ def combinatorial_montecarlo_shapley(
     u: Utility,
     done: StoppingCriterion,
     *,
+    stratified: bool = False,
     n_jobs: int = 1,
     config: ParallelConfig = ParallelConfig(),
     progress: bool = False,
@@ -317,12 +444,21 @@ def combinatorial_montecarlo_shapley(
     subsets for each $i$. Prefer
     [permutation_montecarlo_shapley()][pydvl.value.shapley.montecarlo.permutation_montecarlo_shapley].
 
+    With `stratified=True`, subsets are instead stratified by size: for each
+    index, the sampler cycles through all sizes $k = 0, \dots, n-1$ and samples
+    one subset of size $k$ uniformly at random. Because all sizes contribute
+    equally to the value, each stratum is allocated the same number of samples,
+    and the marginals need no reweighting. This removes the variance due to the
+    size of the subsets and the large importance weights of the uniform
+    sampler.
+
     Parallelization is done by splitting the set of indices across processes and
     computing the sum over subsets $S \subseteq N \setminus \{i\}$ separately.
 
     Args:
         u: Utility object with model, data, and scoring function
         done: Stopping criterion for the computation.
+        stratified: Whether to stratify the sampling of subsets by their size.
         n_jobs: number of parallel jobs across which to distribute the
             computation. Each worker receives a chunk of
             [indices][pydvl.utils.dataset.Dataset.indices]
@@ -333,13 +469,16 @@ def combinatorial_montecarlo_shapley(
 
     Returns:
         Object with the data values.
+
+    !!! tip "Changed in version 0.7.1"
+        Added the option to stratify the sampling by subset size.
     """
 
     map_reduce_job: MapReduceJob[NDArray, ValuationResult] = MapReduceJob(
         u.data.indices,
         map_func=_combinatorial_montecarlo_shapley,
         reduce_func=lambda results: reduce(operator.add, results),
-        map_kwargs=dict(u=u, done=done, progress=progress),
+        map_kwargs=dict(u=u, done=done, stratified=stratified, progress=progress),
         n_jobs=n_jobs,
         config=config,
     )
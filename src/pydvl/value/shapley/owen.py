@@ -4,20 +4,25 @@
 [^1]: <a name="okhrati_multilinear_2021"></a>Okhrati, R., Lipani, A., 2021.
     [A Multilinear Sampling Algorithm to Estimate Shapley Values](https://ieeexplore.ieee.org/abstract/document/9412511).
     In: 2020 25th International Conference on Pattern Recognition (ICPR), pp. 7992–7999. IEEE.
+
+[^2]: <a name="owen_monte_2013"></a>Owen, A.B., 2013.
+    [Monte Carlo theory, methods and examples](https://artowen.su.domains/mc/).
+    Chapter 17: Quasi-Monte Carlo.
 """
 
 import operator
 from enum import Enum
 from functools import reduce
 from itertools import cycle, takewhile
-from typing import Optional, Sequence
+from typing import Callable, Optional, Sequence
 
 import numpy as np
 from numpy.typing import NDArray
+from scipy.stats import qmc
 from tqdm import tqdm
 
 from pydvl.parallel import MapReduceJob, ParallelConfig
-from pydvl.utils import Utility, random_powerset
+from pydvl.utils import Utility
 from pydvl.utils.types import Seed
 from pydvl.value import ValuationResult
 from pydvl.value.stopping import MinUpdates
@@ -30,6 +35,33 @@ class OwenAlgorithm(Enum):
     Antithetic = "antithetic"
 
 
+def _uniform_sampler(
+    dim: int, rng: np.random.Generator
+) -> Callable[[int], NDArray[np.float_]]:
+    """Returns a function drawing points from the unit cube of dimension `dim`.
+
+    Points are taken from a scrambled Sobol sequence, which covers the cube more
+    evenly than independent uniform draws, and thus reduces the error of the
+    Monte Carlo estimate of the integrand for the same number of samples.
+    See e.g. (Owen, 2013)<sup><a href="#owen_monte_2013">2</a></sup>. Because
+    Sobol sequences are only available up to dimension
+    `scipy.stats.qmc.Sobol.MAXDIM`, independent uniform draws are used beyond
+    it.
+
+    Args:
+        dim: Dimension of the cube.
+        rng: Random number generator used to scramble the sequence, or to draw
+            the points if no sequence is used.
+
+    Returns:
+        A function taking the number of points to draw and returning them as
+            an array of shape `(n_points, dim)`.
+    """
+    if 0 < dim <= qmc.Sobol.MAXDIM:
+        return qmc.Sobol(d=dim, scramble=True, seed=rng).random
+    return lambda n_points: rng.uniform(size=(n_points, dim))
+
+
 def _owen_sampling_shapley(
     indices: Sequence[int],
     u: Utility,
@@ -44,7 +76,9 @@ def _owen_sampling_shapley(
     r"""This is the algorithm as detailed in the paper: to compute the outer
     integral over q ∈ [0,1], use uniformly distributed points for evaluation
     of the integrand. For the integrand (the expected marginal utility over the
-    power set), use Monte Carlo.
+    power set), use quasi-Monte Carlo: a sample is included in a subset if the
+    corresponding coordinate of a point of a scrambled Sobol sequence is
+    greater than q.
 
     !!! Todo
         We might want to try better quadrature rules like Gauss or Rombert or
@@ -83,9 +117,16 @@ def _owen_sampling_shapley(
         pbar.refresh()
         e = np.zeros(max_q)
         subset = np.setxor1d(u.data.indices, [idx], assume_unique=True)
+        sampler = _uniform_sampler(len(subset), rng)
         for j, q in enumerate(q_steps):
-            for s in random_powerset(subset, n_samples=n_samples, q=q, seed=rng):
-                marginal = u({idx}.union(s)) - u(s)
+            for point in sampler(n_samples):
+                s = subset[point > q]
+                # If all other samples are drawn (e.g. for q=0), the full set
+                # is reached, whose utility is cached
+                if len(s) == len(subset):
+                    marginal = u.total_utility - u(s)
+                else:
+                    marginal = u({idx}.union(s)) - u(s)
                 if method == OwenAlgorithm.Antithetic and q != 0.5:
                     s_complement = np.setxor1d(subset, s, assume_unique=True)
                     marginal += u({idx}.union(s_complement)) - u(s_complement)
@@ -146,7 +187,8 @@ def owen_sampling_shapley(
     Args:
         u: [Utility][pydvl.utils.utility.Utility] object holding data, model
             and scoring function.
-        n_samples: Numer of sets to sample for each value of q
+        n_samples: Numer of sets to sample for each value of q. Powers of 2
+            are best, because subsets are sampled with a Sobol sequence.
         max_q: Number of subdivisions for q ∈ [0,1] (the element sampling
             probability) used to approximate the outer integral.
         method: Selects the algorithm to use, see the description. Either
@@ -169,7 +211,13 @@ def owen_sampling_shapley(
     !!! tip "Changed in version 0.5.0"
         Support for parallel computation and enable antithetic sampling.
 
+    !!! tip "Changed in version 0.7.1"
+        Subsets are sampled with a scrambled Sobol sequence.
+
     """
+    # Compute the utility of the full set once, before sending u to the workers
+    _ = u.total_utility
+
     map_reduce_job: MapReduceJob[NDArray, ValuationResult] = MapReduceJob(
         u.data.indices,
         map_func=_owen_sampling_shapley,
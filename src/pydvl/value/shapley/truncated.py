@@ -134,7 +134,7 @@ class RelativeTruncation(TruncationPolicy):
         super().__init__()
         self.rtol = rtol
         logger.info("Computing total utility for permutation truncation.")
-        self.total_utility = u(u.data.indices)
+        self.total_utility = u.total_utility
 
     def _check(self, idx: int, score: float) -> bool:
         # Explicit cast for the benefit of mypy 🤷
@@ -159,7 +159,7 @@ class BootstrapTruncation(TruncationPolicy):
         super().__init__()
         self.n_samples = n_samples
         logger.info("Computing total utility for permutation truncation.")
-        self.total_utility = u(u.data.indices)
+        self.total_utility = u.total_utility
         self.count: int = 0
         self.variance: float = 0
         self.mean: float = 0
@@ -0,0 +1,37 @@
+import pickle
+from functools import partial
+
+import pytest
+
+from pydvl.utils.functional import free_arguments, maybe_add_argument
+
+
+def fun(a: int, b: int = 1) -> int:
+    return a + b
+
+
+def test_free_arguments():
+    assert free_arguments(fun) == {"a", "b"}
+    assert free_arguments(partial(fun, b=2)) == {"a", "b"}
+    assert free_arguments(maybe_add_argument(fun, "c")) == {"a", "b"}
+    assert free_arguments(partial(maybe_add_argument(fun, "c"), c=2)) == {"a", "b"}
+
+
+def test_maybe_add_argument():
+    assert maybe_add_argument(fun, "a") is fun
+
+    wrapped = maybe_add_argument(fun, "c")
+    assert wrapped is not fun
+    assert wrapped(1, b=2, c=3) == 3
+    assert wrapped(1) == 2
+    with pytest.raises(TypeError):
+        wrapped(1, d=3)
+
+    wrapped_twice = maybe_add_argument(wrapped, "d")
+    assert wrapped_twice(1, c=3, d=4) == 2
+    assert maybe_add_argument(partial(fun, b=2), "b")(1, b=5) == 6
+
+
+def test_maybe_add_argument_pickle():
+    wrapped = pickle.loads(pickle.dumps(maybe_add_argument(fun, "c")))
+    assert wrapped(1, c=3) == 2
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+from numpy.random import SeedSequence
+from sklearn.linear_model import LinearRegression
+
+from pydvl.utils.types import SupervisedModel, ensure_seed_sequence
+
+
+@pytest.mark.parametrize("seed", [None, 42, np.int64(42)])
+def test_ensure_seed_sequence_from_int(seed):
+    seed_sequence = ensure_seed_sequence(seed)
+    assert isinstance(seed_sequence, SeedSequence)
+    if seed is not None:
+        assert seed_sequence.entropy == seed
+
+
+def test_ensure_seed_sequence_passthrough():
+    seed_sequence = SeedSequence(42)
+    assert ensure_seed_sequence(seed_sequence) is seed_sequence
+
+
+@pytest.mark.parametrize(
+    "make_bit_generator",
+    [
+        lambda: np.random.Philox(42),
+        lambda: np.random.Philox(key=42),
+        lambda: np.random.PCG64(42),
+    ],
+)
+def test_ensure_seed_sequence_from_bit_generator(make_bit_generator):
+    bit_generator = make_bit_generator()
+    seed_sequence = ensure_seed_sequence(bit_generator)
+    assert isinstance(seed_sequence, SeedSequence)
+    assert np.all(
+        seed_sequence.entropy == ensure_seed_sequence(make_bit_generator()).entropy
+    )
+    # Wrapping the bit generator in a Generator doesn't change the sequence
+    assert np.all(
+        seed_sequence.entropy
+        == ensure_seed_sequence(np.random.default_rng(bit_generator)).entropy
+    )
+    # The bit generator is not advanced
+    assert bit_generator.random_raw() == make_bit_generator().random_raw()
+
+
+@pytest.mark.parametrize("wrap", [lambda bg: bg, np.random.default_rng])
+def test_ensure_seed_sequence_from_philox_counter(wrap):
+    without_counter = ensure_seed_sequence(wrap(np.random.Philox(42)))
+    with_counter = ensure_seed_sequence(wrap(np.random.Philox(42, counter=7)))
+    assert np.any(without_counter.entropy != with_counter.entropy)
+
+
+def test_supervised_model_isinstance():
+    assert isinstance(LinearRegression(), SupervisedModel)
+    assert not isinstance(object(), SupervisedModel)
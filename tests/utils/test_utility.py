@@ -1,4 +1,5 @@
 # TODO add more tests!
+import pickle
 import warnings
 
 import numpy as np
@@ -107,3 +108,23 @@ def test_different_cache_signature(
     assert u1.signature != u2.signature
     assert u1.signature == u1.signature
     assert u2.signature == u2.signature
+
+
+@pytest.mark.parametrize("a, b, num_points", [(2, 0, 8)])
+def test_total_utility(linear_dataset, mocker):
+    u = Utility(
+        model=LinearRegression(),
+        data=linear_dataset,
+        scorer=Scorer("r2"),
+        enable_cache=False,
+    )
+    spy = mocker.spy(u, "_utility_wrapper")
+    assert u.total_utility == u(u.data.indices)
+    assert spy.call_count == 2
+
+    for _ in range(3):
+        u.total_utility
+    assert spy.call_count == 2
+
+    u2 = pickle.loads(pickle.dumps(u))
+    assert u2.total_utility == u.total_utility
@@ -11,6 +11,7 @@ from pydvl.utils.status import Status
 from pydvl.value import ValuationResult
 
 from . import polynomial
+from .utils import cached_combinatorial_exact_shapley
 
 
 @pytest.fixture(scope="function")
@@ -114,10 +115,7 @@ def linear_shapley(linear_dataset, scorer, n_jobs):
     u = Utility(
         LinearRegression(), data=linear_dataset, scorer=scorer, enable_cache=False
     )
-
-    from pydvl.value.shapley.naive import combinatorial_exact_shapley
-
-    exact_values = combinatorial_exact_shapley(u, progress=False, n_jobs=n_jobs)
+    exact_values = cached_combinatorial_exact_shapley(u, n_jobs=n_jobs)
     return u, exact_values
 
 
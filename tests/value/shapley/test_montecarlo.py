@@ -1,8 +1,11 @@
 import logging
+import operator
 from copy import copy, deepcopy
+from functools import reduce
 
 import numpy as np
 import pytest
+from numpy.random import SeedSequence
 from sklearn.linear_model import LinearRegression
 
 from pydvl.parallel.config import ParallelConfig
@@ -12,12 +15,17 @@ from pydvl.utils.score import Scorer, squashed_r2
 from pydvl.utils.types import Seed
 from pydvl.value import compute_shapley_values
 from pydvl.value.shapley import ShapleyMode
-from pydvl.value.shapley.naive import combinatorial_exact_shapley
+from pydvl.value.shapley.montecarlo import (
+    _permutation_montecarlo_batch,
+    _permutation_montecarlo_one_step,
+    permutation_montecarlo_shapley,
+)
+from pydvl.value.shapley.truncated import NoTruncation
 from pydvl.value.stopping import MaxChecks, MaxUpdates
 
 from .. import check_rank_correlation, check_total_value, check_values
 from ..conftest import polynomial_dataset
-from ..utils import call_fn_multiple_seeds
+from ..utils import cached_combinatorial_exact_shapley, call_fn_multiple_seeds
 
 log = logging.getLogger(__name__)
 
@@ -27,6 +35,20 @@ log = logging.getLogger(__name__)
     "num_samples, fun, rtol, atol, kwargs",
     [
         (12, ShapleyMode.PermutationMontecarlo, 0.1, 1e-5, {"done": MaxUpdates(10)}),
+        (
+            12,
+            ShapleyMode.PermutationMontecarlo,
+            0.1,
+            1e-5,
+            {"done": MaxUpdates(10), "antithetic": True},
+        ),
+        (
+            12,
+            ShapleyMode.PermutationMontecarlo,
+            0.1,
+            1e-5,
+            {"done": MaxUpdates(10), "batch_size": 4},
+        ),
         # FIXME! it should be enough with 2**(len(data)-1) samples
         (
             8,
@@ -35,6 +57,13 @@ log = logging.getLogger(__name__)
             1e-4,
             {"done": MaxUpdates(2**10)},
         ),
+        (
+            8,
+            ShapleyMode.CombinatorialMontecarlo,
+            0.2,
+            1e-4,
+            {"done": MaxUpdates(2**9), "stratified": True},
+        ),
         (12, ShapleyMode.Owen, 0.1, 1e-4, dict(n_samples=4, max_q=200)),
         (12, ShapleyMode.OwenAntithetic, 0.1, 1e-4, dict(n_samples=4, max_q=200)),
         (
@@ -67,6 +96,39 @@ def test_analytic_montecarlo_shapley(
     check_values(values, exact_values, rtol=rtol, atol=atol)
 
 
+@pytest.mark.parametrize("a, b, num_points", [(2, 0, 21)])
+@pytest.mark.parametrize("antithetic", [False, True])
+def test_permutation_montecarlo_batch(linear_dataset, antithetic: bool):
+    """A batch of permutations yields the same values as processing each of
+    them separately."""
+    u = Utility(LinearRegression(), data=linear_dataset, scorer="r2")
+    seeds = SeedSequence(42).spawn(4)
+    algorithm = "permutation_montecarlo_shapley"
+
+    batched = _permutation_montecarlo_batch(
+        u, NoTruncation(), algorithm, antithetic, seeds=seeds
+    )
+    unbatched = reduce(
+        operator.add,
+        (
+            _permutation_montecarlo_one_step(
+                u, NoTruncation(), algorithm, antithetic, seed=seed
+            )
+            for seed in seeds
+        ),
+    )
+
+    np.testing.assert_array_equal(batched.indices, unbatched.indices)
+    np.testing.assert_allclose(batched.values, unbatched.values)
+    np.testing.assert_array_equal(batched.counts, unbatched.counts)
+
+
+@pytest.mark.parametrize("num_samples", [4])
+def test_permutation_montecarlo_invalid_batch_size(dummy_utility):
+    with pytest.raises(ValueError):
+        permutation_montecarlo_shapley(dummy_utility, MaxUpdates(1), batch_size=0)
+
+
 test_cases_montecarlo_shapley_reproducible_stochastic = [
     # TODO Add once issue #416 is closed.
     # (12, ShapleyMode.PermutationMontecarlo, {"done": MaxChecks(1)}),
@@ -171,6 +233,10 @@ def test_hoeffding_bound_montecarlo(
     [
         # FIXME: Hoeffding says 400 should be enough
         (ShapleyMode.PermutationMontecarlo, dict(done=MaxUpdates(600))),
+        (
+            ShapleyMode.PermutationMontecarlo,
+            dict(done=MaxUpdates(300), antithetic=True),
+        ),
         (ShapleyMode.CombinatorialMontecarlo, dict(done=MaxUpdates(2**11))),
         (ShapleyMode.Owen, dict(n_samples=2, max_q=300)),
         (ShapleyMode.OwenAntithetic, dict(n_samples=2, max_q=300)),
@@ -304,7 +370,7 @@ def test_grouped_linear_montecarlo_shapley(
         scorer=scorer,
         cache_options=MemcachedConfig(client_config=memcache_client_config),
     )
-    exact_values = combinatorial_exact_shapley(grouped_linear_utility, progress=False)
+    exact_values = cached_combinatorial_exact_shapley(grouped_linear_utility)
 
     values = compute_shapley_values(
         grouped_linear_utility, mode=fun, progress=False, n_jobs=n_jobs, **kwargs
@@ -1,25 +1,122 @@
 from __future__ import annotations
 
+import hashlib
 from copy import deepcopy
-from typing import Callable, Tuple
+from typing import Any, Callable, Dict, Tuple
 
-from pydvl.utils.types import Seed
+import numpy as np
+from joblib import Parallel, delayed, effective_n_jobs
+from sklearn.base import BaseEstimator, clone
+
+from pydvl.utils import Utility
+from pydvl.utils.caching import serialize
+from pydvl.utils.types import Seed, ensure_seed_sequence
+from pydvl.value import ValuationResult
+from pydvl.value.shapley.naive import combinatorial_exact_shapley
+
+_exact_shapley_cache: Dict[bytes, ValuationResult] = {}
+
+
+def _copy_argument(arg: Any) -> Any:
+    """Copies an argument for one call in `call_fn_multiple_seeds()`.
+
+    Arrays are passed as read-only views and lists and dicts are copied
+    shallowly. scikit-learn estimators are cloned, i.e. only their parameters
+    are copied and not their fitted state. Anything else is deep-copied.
+    """
+    if isinstance(arg, np.ndarray):
+        view = arg.view()
+        view.setflags(write=False)
+        return view
+    if isinstance(arg, (dict, list)):
+        return arg.copy()
+    if isinstance(arg, BaseEstimator):
+        return clone(arg)
+    return deepcopy(arg)
 
 
 def call_fn_multiple_seeds(
-    fn: Callable, *args, seeds: Tuple[Seed, ...], **kwargs
+    fn: Callable, *args, seeds: Tuple[Seed, ...], n_jobs_seeds: int = 1, **kwargs
 ) -> Tuple:
     """
-    Execute a function multiple times with different seeds. It copies the arguments
-    and keyword arguments before passing them to the function.
+    Execute a function multiple times with different seeds. The arguments and
+    keyword arguments are copied for each call: arrays are passed as read-only
+    views, lists and dicts are copied shallowly, scikit-learn estimators are
+    cloned, and everything else is deep-copied. This means that `fn` must not
+    mutate arrays or the contents of containers it is passed. Calls are run
+    sequentially unless `n_jobs_seeds` is set, in which case the same copies
+    are sent to workers of joblib's loky backend.
+
+    Seeds are converted to `SeedSequence` objects once before dispatching, so
+    that `fn` receives ready to use seeds. The same seed always yields the same
+    sequence, so results are reproducible.
 
     Args:
         fn: The function to execute.
         args: The arguments to pass to the function.
         seeds: The seeds to use.
+        n_jobs_seeds: Number of parallel jobs across which to distribute the
+            calls for the different seeds. This is kept separate from `n_jobs`,
+            which is passed on to `fn` in `kwargs`. Functions which already
+            run in parallel should be called with the default of 1, to avoid
+            nesting process pools.
         kwargs: The keyword arguments to pass to the function.
 
     Returns:
         A tuple of the results of the function.
     """
-    return tuple(fn(*deepcopy(args), **deepcopy(kwargs), seed=seed) for seed in seeds)
+    seed_sequences = [ensure_seed_sequence(seed) for seed in seeds]
+    calls = (
+        delayed(fn)(
+            *(_copy_argument(arg) for arg in args),
+            **{k: _copy_argument(v) for k, v in kwargs.items()},
+            seed=seed,
+        )
+        for seed in seed_sequences
+    )
+    n_jobs_seeds = min(len(seeds), effective_n_jobs(n_jobs_seeds))
+    if n_jobs_seeds == 1:
+        results = [None] * len(seed_sequences)
+        for i, (f, call_args, call_kwargs) in enumerate(calls):
+            results[i] = f(*call_args, **call_kwargs)
+        return tuple(results)
+
+    return tuple(Parallel(n_jobs=n_jobs_seeds, backend="loky")(calls))
+
+
+def cached_combinatorial_exact_shapley(u: Utility, **kwargs) -> ValuationResult:
+    """Computes exact Shapley values with
+    [combinatorial_exact_shapley()][pydvl.value.shapley.naive.combinatorial_exact_shapley],
+    memoizing them in the current process.
+
+    Different parametrizations of a test often use the same model, data and
+    scorer, so results are keyed by a digest of these and of the settings of
+    the utility which affect its values, instead of the signature of the
+    utility, which differs for every `Utility` object. This avoids the network
+    round trips of memcached.
+
+    Args:
+        u: The utility to compute values for.
+        kwargs: Additional arguments for `combinatorial_exact_shapley()`.
+
+    Returns:
+        A copy of the (possibly cached) values.
+    """
+    key = hashlib.sha256(
+        serialize(
+            (
+                u.model,
+                u.data,
+                u.scorer,
+                u.default_score,
+                u.score_range,
+                u.catch_errors,
+                u.clone_before_fit,
+            )
+        )
+    ).digest()
+    if key not in _exact_shapley_cache:
+        _exact_shapley_cache[key] = combinatorial_exact_shapley(
+            u, progress=False, **kwargs
+        )
+    return deepcopy(_exact_shapley_cache[key])